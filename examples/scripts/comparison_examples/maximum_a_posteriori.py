@@ -1,9 +1,12 @@
+import os
+
 import numpy as np
 
 import pybop
 
 # Set variables
 sigma = 0.002
+rng = np.random.default_rng(int(os.environ.get("PYBOP_SEED", 0)))
 
 # Construct and update initial parameter values
 parameter_set = pybop.ParameterSet("Chen2020")
@@ -25,7 +28,6 @@ parameters = pybop.Parameters(
         bounds=[0.3, 0.8],
         initial_value=0.653,
         true_value=parameter_set["Negative electrode active material volume fraction"],
-        transformation=pybop.LogTransformation(),
     ),
     pybop.Parameter(
         "Positive electrode active material volume fraction",
@@ -33,7 +35,6 @@ parameters = pybop.Parameters(
         bounds=[0.4, 0.7],
         initial_value=0.657,
         true_value=parameter_set["Positive electrode active material volume fraction"],
-        transformation=pybop.LogTransformation(),
     ),
 )
 
@@ -47,18 +48,16 @@ experiment = pybop.Experiment(
     ]
 )
 values = model.predict(initial_state={"Initial SoC": 0.5}, experiment=experiment)
-corrupt_values = values["Voltage [V]"].data + np.random.normal(
-    0, sigma, len(values["Voltage [V]"].data)
-)
+voltage = values["Voltage [V]"].data
+current = values["Current [A]"].data
+time_s = values["Time [s]"].data
+corrupt_values = np.empty_like(voltage)
+rng.standard_normal(out=corrupt_values)
+corrupt_values *= sigma
+corrupt_values += voltage
 
 # Form dataset
-dataset = pybop.Dataset(
-    {
-        "Time [s]": values["Time [s]"].data,
-        "Current function [A]": values["Current [A]"].data,
-        "Voltage [V]": corrupt_values,
-    }
-)
+dataset = pybop.Dataset.from_arrays(time_s, current, corrupt_values)
 
 # Generate problem, cost function, and optimisation class
 problem = pybop.FittingProblem(model, parameters, dataset)
@@ -75,18 +74,29 @@ optim = pybop.IRPropMin(
 results = optim.run()
 print("True parameters:", parameters.true_value())
 
-# Plot the timeseries output
-pybop.plot.quick(problem, problem_inputs=results.x, title="Optimised Comparison")
+# Plot the results, unless running headless (e.g. for benchmarking)
+if not os.environ.get("PYBOP_HEADLESS"):
+    # Plot the timeseries output
+    pybop.plot.quick(problem, problem_inputs=results.x, title="Optimised Comparison")
 
-# Plot convergence
-pybop.plot.convergence(optim)
+    # Plot convergence
+    pybop.plot.convergence(optim)
 
-# Plot the parameter traces
-pybop.plot.parameters(optim)
+    # Plot the parameter traces
+    pybop.plot.parameters(optim)
 
-# Plot the cost landscape
-pybop.plot.contour(cost, steps=15)
+    # Plot the cost landscape
+    pybop.plot.contour(
+        cost,
+        steps=15,
+        # parallel=True,  # uncomment to enable parallelisation (macOS/WSL/Linux only)
+    )
 
-# Plot the cost landscape with optimisation path
-bounds = np.asarray([[0.35, 0.7], [0.45, 0.625]])
-pybop.plot.contour(optim, bounds=bounds, steps=15)
+    # Plot the cost landscape with optimisation path
+    bounds = np.asarray([[0.35, 0.7], [0.45, 0.625]])
+    pybop.plot.contour(
+        optim,
+        bounds=bounds,
+        steps=15,
+        # parallel=True,  # uncomment to enable parallelisation (macOS/WSL/Linux only)
+    )
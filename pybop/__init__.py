@@ -147,6 +147,7 @@ from .optimisers.base_pints_optimiser import BasePintsOptimiser
 from .optimisers.scipy_optimisers import (
     BaseSciPyOptimiser,
     SciPyMinimize,
+    MultiStartLBFGSB,
     SciPyDifferentialEvolution
 )
 from .optimisers.pints_optimisers import (
@@ -31,6 +31,39 @@ class Dataset:
         self.data = data_dictionary
         self.domain = domain or "Time [s]"
 
+    @classmethod
+    def from_arrays(cls, time, current, voltage):
+        """
+        Construct a time-domain dataset from time, current and voltage arrays.
+
+        The three series are copied into a single contiguous array of shape (3, N),
+        and each entry in the dataset is a view onto one row of this array.
+
+        Parameters
+        ----------
+        time : array-like
+            The time series, stored as "Time [s]".
+        current : array-like
+            The applied current, stored as "Current function [A]".
+        voltage : array-like
+            The measured voltage, stored as "Voltage [V]".
+
+        Returns
+        -------
+        pybop.Dataset
+            The dataset containing the three series.
+        """
+        buffer = np.stack(
+            [np.asarray(time), np.asarray(current), np.asarray(voltage)]
+        ).astype(np.float64, copy=False)
+        return cls(
+            {
+                "Time [s]": buffer[0],
+                "Current function [A]": buffer[1],
+                "Voltage [V]": buffer[2],
+            }
+        )
+
     def __repr__(self):
         """
         Return a string representation of the Dataset instance.
@@ -1,3 +1,4 @@
+import math
 from typing import Optional, Union
 
 import numpy as np
@@ -9,6 +10,40 @@ from pybop.parameters.parameter import Inputs, Parameter, Parameters
 from pybop.parameters.priors import BasePrior, JointLogPrior, Uniform
 from pybop.problems.base_problem import BaseProblem
 
+try:
+    from numba import njit
+
+    GOT_NUMBA = True
+except ImportError:  # pragma: no cover
+    GOT_NUMBA = False
+
+SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+
+def _gaussian_log_likelihood(r: np.ndarray, sigma: np.ndarray) -> float:
+    """
+    Gaussian log-likelihood of real residuals ``r`` with shape (n_outputs, n_data)
+    and per-output standard deviations ``sigma``, evaluated in a single pass.
+    """
+    n_outputs, n_data = r.shape
+    e = 0.0
+    for k in range(n_outputs):
+        inv = 1.0 / sigma[k]
+        s = 0.0
+        for i in range(n_data):
+            z = r[k, i] * inv
+            s += z * z
+        e += -0.5 * s - n_data * math.log(sigma[k] * SQRT_2PI)
+    return e
+
+
+if GOT_NUMBA:
+    # Compiled objects are cached on disk, so the JIT cost is only paid on the
+    # first call after installation rather than once per process.
+    _gaussian_log_likelihood = njit(fastmath=True, cache=True, error_model="numpy")(
+        _gaussian_log_likelihood
+    )
+
 
 class BaseLikelihood(BaseCost):
     """
@@ -249,11 +284,18 @@ class GaussianLogLikelihood(BaseLikelihood):
 
         # Calculate residuals and error
         r = np.asarray([self._target[signal] - y[signal] for signal in self.signal])
-        e = np.sum(
-            self._logpi
-            - self.n_data * np.log(sigma)
-            - np.sum(np.real(r * np.conj(r)), axis=1) / (2.0 * sigma**2.0)
-        )
+        if GOT_NUMBA and np.isrealobj(r) and np.all(np.isfinite(sigma) & (sigma > 0)):
+            # The compiled kernel assumes finite, positive standard deviations
+            e = _gaussian_log_likelihood(
+                np.ascontiguousarray(r, dtype=np.float64),
+                np.asarray(sigma, dtype=np.float64),
+            )
+        else:
+            e = np.sum(
+                self._logpi
+                - self.n_data * np.log(sigma)
+                - np.sum(np.real(r * np.conj(r)), axis=1) / (2.0 * sigma**2.0)
+            )
 
         if dy is not None:
             dl = np.sum((np.sum((r * dy.T), axis=2) / (sigma**2.0)), axis=1)
@@ -289,6 +289,41 @@ class SciPyMinimize(BaseSciPyOptimiser):
         return "SciPyMinimize"
 
 
+class MultiStartLBFGSB(SciPyMinimize):
+    """
+    Multi-start L-BFGS-B optimiser using the analytical cost gradient.
+
+    This class runs SciPy's L-BFGS-B method from ``n_restarts`` initial positions,
+    one after another. The first run starts from ``x0`` and the remainder start
+    from values sampled from the parameter priors, with the best result returned.
+    This gives wider coverage of the cost landscape than a single gradient-based
+    run, at the cost of one full local optimisation per restart.
+
+    Parameters
+    ----------
+    cost : pybop.BaseCost
+        The cost to optimise, which must provide gradients.
+    n_restarts : int, optional
+        The number of L-BFGS-B runs (default: 8).
+    **optimiser_kwargs : optional
+        Valid SciPy Minimize option keys and their values, see
+        ``pybop.SciPyMinimize``.
+
+    See Also
+    --------
+    pybop.SciPyMinimize : The optimiser this class is based on.
+    """
+
+    def __init__(self, cost, n_restarts: int = 8, **optimiser_kwargs):
+        optimiser_options = dict(method="L-BFGS-B", jac=True, multistart=n_restarts)
+        optimiser_options.update(**optimiser_kwargs)
+        super().__init__(cost, **optimiser_options)
+
+    def name(self):
+        """Provides the name of the optimisation strategy."""
+        return "MultiStartLBFGSB"
+
+
 class SciPyDifferentialEvolution(BaseSciPyOptimiser):
     """
     Adapts SciPy's differential_evolution function for global optimisation.
@@ -1,6 +1,9 @@
 import copy
 import json
+import os
 import types
+from collections.abc import Mapping
+from functools import lru_cache
 from numbers import Number
 from typing import Optional, Union
 
@@ -26,7 +29,7 @@ class ParameterSet:
 
     Parameters
     ----------
-    parameter_set : Union[str, dict, ParameterValues], optional
+    parameter_set : Union[str, Mapping, ParameterValues], optional
         A dictionary of parameters to initialise the ParameterSet with. If not provided, an empty dictionary is used.
     json_path : str, optional
         Path to a JSON file containing parameter data. If provided, parameters will be imported from this file during
@@ -37,7 +40,7 @@ class ParameterSet:
 
     def __init__(
         self,
-        parameter_set: Union[str, dict, ParameterValues] = None,
+        parameter_set: Union[str, Mapping, ParameterValues] = None,
         json_path: Optional[str] = None,
         formation_concentrations: Optional[bool] = False,
     ):
@@ -72,6 +75,8 @@ class ParameterSet:
         """
         Evaluate a parameter in the parameter set.
 
+        Repeated sub-expressions within the symbol are only evaluated once.
+
         Parameters
         ----------
         symbol : pybamm.Symbol or Number
@@ -82,17 +87,31 @@ class ParameterSet:
         float
             The value of the parameter.
         """
+        return ParameterSet._evaluate_symbol(symbol, params, {})
+
+    @staticmethod
+    def _evaluate_symbol(symbol: Union[Symbol, Number], params: dict, cache: dict):
+        """
+        Recursively evaluate a symbol, storing the value of each sub-expression in
+        ``cache`` keyed by its pybamm id. The cache must not outlive a single call,
+        as the parameter values may change between evaluations.
+        """
         if isinstance(symbol, (Number, np.float64)):
             return symbol
         if isinstance(symbol, Scalar):
             return symbol.value
+        if symbol.id in cache:
+            return cache[symbol.id]
         if isinstance(symbol, (Parameter, FunctionParameter)):
-            return ParameterSet.evaluate_symbol(params[symbol.name], params)
-        new_children = [
-            Scalar(ParameterSet.evaluate_symbol(child, params))
-            for child in symbol.children
-        ]
-        return symbol.create_copy(new_children).evaluate()
+            value = ParameterSet._evaluate_symbol(params[symbol.name], params, cache)
+        else:
+            new_children = [
+                Scalar(ParameterSet._evaluate_symbol(child, params, cache))
+                for child in symbol.children
+            ]
+            value = symbol.create_copy(new_children).evaluate()
+        cache[symbol.id] = value
+        return value
 
     def keys(self) -> list:
         """
@@ -152,9 +171,10 @@ class ParameterSet:
                 print(
                     "The JSON file was not recognised as a BPX parameter set. Importing as a JSON file."
                 )
-                with open(self._json_path) as file:
-                    params = json.load(file)
-                    self.parameter_values = ParameterValues(params)
+                params = copy.deepcopy(
+                    _load_json(self._json_path, os.stat(self._json_path).st_mtime_ns)
+                )
+                self.parameter_values = ParameterValues(params)
         else:
             raise ValueError("No path was provided.")
 
@@ -275,10 +295,23 @@ class ParameterSet:
             return ParameterValues(parameter_set)
         elif isinstance(parameter_set, ParameterValues):
             return parameter_set.copy()
+        elif isinstance(parameter_set, Mapping):
+            return ParameterValues(dict(parameter_set))
         else:
             return parameter_set.parameter_values.copy()
 
 
+@lru_cache(maxsize=32)
+def _load_json(json_path: str, mtime_ns: int) -> dict:
+    """
+    Load and cache a JSON parameter file. The modification time is part of the
+    cache key so that changes to the file on disk are picked up. The returned
+    dictionary is shared between calls and must be copied before modification.
+    """
+    with open(json_path) as file:
+        return json.load(file)
+
+
 def set_formation_concentrations(parameter_set):
     """
     Compute the concentration of lithium in the positive electrode assuming that
@@ -3,6 +3,8 @@ from functools import partial
 from typing import Union
 
 import numpy as np
+from pints import ParallelEvaluator as PintsParallelEvaluator
+from pints import SequentialEvaluator as PintsSequentialEvaluator
 from scipy.interpolate import griddata
 
 from pybop import BaseCost, BaseOptimiser, Optimisation
@@ -17,6 +19,7 @@ def contour(
     steps: int = 10,
     show: bool = True,
     use_optim_log: bool = False,
+    parallel: Union[bool, int] = False,
     **layout_kwargs,
 ):
     """
@@ -44,6 +47,11 @@ def contour(
         If True, the figure is shown upon creation (default: True).
     use_optim_log : bool, optional
         If True, the optimisation log is used to shape the cost landscape (default: False).
+    parallel : bool or int, optional
+        If True, the grid is evaluated in parallel using all available cores. If an
+        integer is given, it sets the number of worker processes (default: False).
+        Parallel evaluation is only available on macOS/WSL/Linux, as the cost must
+        otherwise be pickled for the spawned worker processes.
     **layout_kwargs : optional
         Valid Plotly layout keys and their values,
         e.g. `xaxis_title="Time [s]"` or
@@ -99,35 +107,32 @@ def contour(
     x = np.linspace(bounds[0, 0], bounds[0, 1], steps)
     y = np.linspace(bounds[1, 0], bounds[1, 1], steps)
 
-    # Initialize cost matrix
-    costs = np.zeros((len(y), len(x)))
+    # Evaluate the cost over the grid, ordered such that costs[j, i] = f(x[i], y[j])
+    positions = [np.asarray([xi, yj] + additional_values) for yj in y for xi in x]
+    function = partial(cost_call, calculate_grad=True) if gradient else cost_call
+    if parallel is True or parallel >= 1:
+        n_workers = (
+            PintsParallelEvaluator.cpu_count() if parallel is True else int(parallel)
+        )
+        evaluator = PintsParallelEvaluator(
+            function, n_workers=min(n_workers, len(positions))
+        )
+    else:
+        evaluator = PintsSequentialEvaluator(function)
+    results = evaluator.evaluate(positions)
 
     if gradient:
         grad_parameter_costs = []
-
-        # Determine the number of gradient outputs from cost.compute
-        num_gradients = cost_call(
-            np.asarray([x[0], y[0]] + additional_values),
-            calculate_grad=True,
-        )[1].shape[0]
-
-        # Create an array to hold each gradient output
-        grads = [np.zeros((len(y), len(x))) for _ in range(num_gradients)]
-
-    # Populate cost matrix
-    for i, xi in enumerate(x):
-        for j, yj in enumerate(y):
-            if gradient:
-                costs[j, i], (*current_grads,) = cost_call(
-                    np.asarray([xi, yj] + additional_values),
-                    calculate_grad=True,
-                )
-                for k, grad_output in enumerate(current_grads):
-                    grads[k][j, i] = grad_output
-            else:
-                costs[j, i] = cost_call(
-                    np.asarray([xi, yj] + additional_values),
-                )
+        costs = np.asarray([result[0] for result in results]).reshape(len(y), len(x))
+        grad_values = np.asarray([result[1] for result in results])
+
+        # Split the gradient outputs into one array per parameter
+        grads = [
+            grad_values[:, k].reshape(len(y), len(x))
+            for k in range(grad_values.shape[1])
+        ]
+    else:
+        costs = np.asarray(results, dtype=float).reshape(len(y), len(x))
 
     # Append the arrays to the grad_parameter_costs list
     if gradient:
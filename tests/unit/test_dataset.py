@@ -60,6 +60,19 @@ class TestDataset:
         dataset = dataset.get_subset(list(range(5)))
         assert len(dataset[dataset.domain]) == 5
 
+        # Test construction from arrays
+        dataset = pybop.Dataset.from_arrays(
+            solution["Time [s]"].data,
+            solution["Current [A]"].data,
+            solution["Voltage [V]"].data,
+        )
+        assert dataset.check()
+        np.testing.assert_array_equal(
+            dataset["Voltage [V]"], solution["Voltage [V]"].data
+        )
+        assert dataset["Time [s]"].base is dataset["Voltage [V]"].base
+        assert dataset["Voltage [V]"].flags.c_contiguous
+
         # Form frequency dataset
         data_dictionary = {
             "Frequency [Hz]": np.linspace(-10, 0, 10),
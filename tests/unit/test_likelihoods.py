@@ -3,6 +3,7 @@ import pybamm
 import pytest
 
 import pybop
+from pybop.costs import _likelihoods
 
 
 class TestLikelihoods:
@@ -155,6 +156,37 @@ class TestLikelihoods:
         assert not np.isfinite(cost_fail)
         assert grad_fail.shape == (2,)
 
+    @pytest.mark.skipif(not _likelihoods.GOT_NUMBA, reason="numba is not installed")
+    def test_gaussian_log_likelihood_numba_kernel(self):
+        rng = np.random.default_rng(8)
+        r = rng.standard_normal((2, 50))
+        sigma = np.array([0.5, 1.3])
+        expected = np.sum(
+            -0.5 * r.shape[1] * np.log(2 * np.pi)
+            - r.shape[1] * np.log(sigma)
+            - np.sum(r**2, axis=1) / (2.0 * sigma**2)
+        )
+        result = _likelihoods._gaussian_log_likelihood(r, sigma)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    @pytest.mark.skipif(not _likelihoods.GOT_NUMBA, reason="numba is not installed")
+    @pytest.mark.parametrize("sigma", [0.02, 0.0])
+    def test_gaussian_log_likelihood_numba_matches_numpy(
+        self, one_signal_problem, sigma, monkeypatch
+    ):
+        likelihood = pybop.GaussianLogLikelihood(one_signal_problem)
+        inputs = np.array([0.55, sigma])
+        kernel_result = likelihood(inputs)
+        kernel_grad_result, kernel_grad = likelihood(inputs, calculate_grad=True)
+
+        monkeypatch.setattr(_likelihoods, "GOT_NUMBA", False)
+        numpy_result = likelihood(inputs)
+        numpy_grad_result, numpy_grad = likelihood(inputs, calculate_grad=True)
+
+        np.testing.assert_allclose(kernel_result, numpy_result, rtol=1e-10)
+        np.testing.assert_allclose(kernel_grad_result, numpy_grad_result, rtol=1e-10)
+        np.testing.assert_array_equal(kernel_grad, numpy_grad)
+
     def test_gaussian_log_likelihood_dsigma_scale(self, one_signal_problem):
         likelihood = pybop.GaussianLogLikelihood(one_signal_problem, dsigma_scale=0.05)
         assert likelihood.dsigma_scale == 0.05
@@ -76,6 +76,7 @@ class TestOptimisation:
         "optimiser, expected_name, sensitivities",
         [
             (pybop.SciPyMinimize, "SciPyMinimize", False),
+            (pybop.MultiStartLBFGSB, "MultiStartLBFGSB", True),
             (pybop.SciPyDifferentialEvolution, "SciPyDifferentialEvolution", False),
             (pybop.GradientDescent, "Gradient descent", True),
             (pybop.AdamW, "AdamW", True),
@@ -441,6 +442,18 @@ class TestOptimisation:
         ):
             optim = pybop.SciPyMinimize(cost=cost, jac="Invalid string")
 
+    def test_multistart_lbfgsb(self, cost):
+        optim = pybop.MultiStartLBFGSB(cost=cost, n_restarts=3, max_iterations=3)
+        assert optim.multistart == 3
+        assert optim.needs_sensitivities
+
+        results = optim.run()
+        assert results.n_runs == 3
+        assert len(results.scipy_result) == 3
+        best_index = np.argmin(results.final_cost)
+        np.testing.assert_allclose(results.x_best, results.x[best_index])
+        assert results.final_cost_best == min(results.final_cost)
+
     def test_scipy_minimize_invalid_x0(self, cost):
         # Check a starting point that returns an infinite cost
         invalid_x0 = np.array([1.1])
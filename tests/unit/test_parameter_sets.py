@@ -1,9 +1,47 @@
+from types import MappingProxyType
+
 import numpy as np
 import pytest
 from pybamm import FunctionParameter, Parameter, Scalar
 
 import pybop
 
+_PARAMS_TEMPLATE = MappingProxyType(
+    {
+        "chemistry": "ecm",
+        "Initial SoC": 0.5,
+        "Initial temperature [K]": 25 + 273.15,
+        "Cell capacity [A.h]": 5,
+        "Nominal cell capacity [A.h]": 5,
+        "Ambient temperature [K]": 25 + 273.15,
+        "Current function [A]": 5,
+        "Upper voltage cut-off [V]": 4.2,
+        "Lower voltage cut-off [V]": 3.0,
+        "Cell thermal mass [J/K]": 1000,
+        "Cell-jig heat transfer coefficient [W/K]": 10,
+        "Jig thermal mass [J/K]": 500,
+        "Jig-air heat transfer coefficient [W/K]": 10,
+        "R0 [Ohm]": 0.001,
+        "Element-1 initial overpotential [V]": 0,
+        "Element-2 initial overpotential [V]": 0,
+        "R1 [Ohm]": 0.0002,
+        "R2 [Ohm]": 0.0003,
+        "C1 [F]": 10000,
+        "C2 [F]": 5000,
+        "Entropic change [V/K]": 0.0004,
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def chen2020_set():
+    return pybop.ParameterSet("Chen2020")
+
+
+@pytest.fixture
+def chen2020_copy(chen2020_set):
+    return chen2020_set.copy()
+
 
 class TestParameterSets:
     """
@@ -14,41 +52,14 @@ class TestParameterSets:
 
     @pytest.fixture
     def params_dict(self):
-        return {
-            "chemistry": "ecm",
-            "Initial SoC": 0.5,
-            "Initial temperature [K]": 25 + 273.15,
-            "Cell capacity [A.h]": 5,
-            "Nominal cell capacity [A.h]": 5,
-            "Ambient temperature [K]": 25 + 273.15,
-            "Current function [A]": 5,
-            "Upper voltage cut-off [V]": 4.2,
-            "Lower voltage cut-off [V]": 3.0,
-            "Cell thermal mass [J/K]": 1000,
-            "Cell-jig heat transfer coefficient [W/K]": 10,
-            "Jig thermal mass [J/K]": 500,
-            "Jig-air heat transfer coefficient [W/K]": 10,
-            "R0 [Ohm]": 0.001,
-            "Element-1 initial overpotential [V]": 0,
-            "Element-2 initial overpotential [V]": 0,
-            "R1 [Ohm]": 0.0002,
-            "R2 [Ohm]": 0.0003,
-            "C1 [F]": 10000,
-            "C2 [F]": 5000,
-            "Entropic change [V/K]": 0.0004,
-        }
-
-    def test_parameter_set(self):
+        return dict(_PARAMS_TEMPLATE)
+
+    def test_parameter_set(self, chen2020_copy):
         # Tests parameter set creation and validation
         with pytest.raises(ValueError):
             pybop.ParameterSet("sChen2010s")
 
-        parameter_test = pybop.ParameterSet("Chen2020")
-        np.testing.assert_allclose(
-            parameter_test["Negative electrode active material volume fraction"], 0.75
-        )
-
-        parameter_test = pybop.ParameterSet("Chen2020")
+        parameter_test = chen2020_copy
         np.testing.assert_allclose(
             parameter_test["Negative electrode active material volume fraction"], 0.75
         )
@@ -59,7 +70,7 @@ class TestParameterSets:
             parameter_test["Negative electrode active material volume fraction"] == 0.8
         )
 
-    def test_ecm_parameter_sets(self, params_dict):
+    def test_ecm_parameter_sets(self):
         # Test importing a json file
         json_params = pybop.ParameterSet()
         with pytest.raises(
@@ -82,15 +93,23 @@ class TestParameterSets:
             json_path="examples/parameters/initial_ecm_parameters.json"
         )
 
-        params = pybop.ParameterSet(params_dict)
+        params = pybop.ParameterSet(_PARAMS_TEMPLATE)
         assert json_params.parameter_values == params.parameter_values
 
+        # Test repeated imports of the same file are independent
+        json_params["R0 [Ohm]"] = 0.002
+        repeat_params = pybop.ParameterSet(
+            json_path="examples/parameters/initial_ecm_parameters.json"
+        )
+        assert repeat_params["R0 [Ohm]"] == params["R0 [Ohm]"]
+
         with pytest.raises(
             ValueError,
             match="ParameterSet needs either a parameter_set or json_path as an input, not both.",
         ):
             pybop.ParameterSet(
-                params_dict, json_path="examples/parameters/initial_ecm_parameters.json"
+                _PARAMS_TEMPLATE,
+                json_path="examples/parameters/initial_ecm_parameters.json",
             )
 
         # Test exporting a json file
@@ -143,8 +162,8 @@ class TestParameterSets:
             parameter_set["Initial concentration in positive electrode [mol.m-3]"] > 0
         )
 
-    def test_evaluate_symbol(self):
-        parameter_set = pybop.ParameterSet("Chen2020")
+    def test_evaluate_symbol(self, chen2020_set):
+        parameter_set = chen2020_set
         porosity = parameter_set["Positive electrode porosity"]
         assert isinstance(porosity, float)
 
@@ -158,7 +177,12 @@ class TestParameterSets:
             assert isinstance(value, float)
             np.testing.assert_allclose(value, 1.0 + porosity)
 
-    def test_check_already_exists(self, params_dict):
+        # Test repeated sub-expressions
+        param = Parameter("Positive electrode porosity")
+        value = pybop.ParameterSet.evaluate_symbol(param * (1.0 + param), parameter_set)
+        np.testing.assert_allclose(value, porosity * (1.0 + porosity))
+
+    def test_check_already_exists(self, params_dict, chen2020_copy):
         parameter_set = pybop.ParameterSet(params_dict)
 
         parameter_set.update({"Nominal cell capacity [A.h]": 3})
@@ -173,6 +197,6 @@ class TestParameterSets:
         parameter_set.update({"Unused parameter name": 3}, check_already_exists=False)
         np.testing.assert_allclose(parameter_set["Unused parameter name"], 3)
 
-        parameter_set = pybop.ParameterSet("Chen2020")
+        parameter_set = chen2020_copy
         parameter_set.update({"Nominal cell capacity [A.h]": 3})
         np.testing.assert_allclose(parameter_set["Nominal cell capacity [A.h]"], 3)
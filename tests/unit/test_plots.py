@@ -1,3 +1,4 @@
+import sys
 import warnings
 
 import numpy as np
@@ -122,6 +123,15 @@ class TestPlots:
         # Test with bounds
         pybop.plot.contour(cost, bounds=np.array([[0.5, 0.8], [0.4, 0.7]]), steps=5)
 
+        # Test parallel evaluation matches the sequential landscape, if not on Windows
+        if sys.platform != "win32":
+            bounds = np.array([[0.5, 0.8], [0.4, 0.7]])
+            fig = pybop.plot.contour(cost, bounds=bounds, steps=3)
+            fig_parallel = pybop.plot.contour(
+                cost, bounds=bounds, steps=3, parallel=2
+            )
+            np.testing.assert_allclose(fig_parallel.data[0].z, fig.data[0].z)
+
     @pytest.fixture
     def optim(self, cost):
         # Define and run an example optimisation